@@ -10,6 +10,8 @@ Features:
 - Flexible Speicherung der Nutzerdaten (profiles.json im Benutzerverzeichnis unter DeutschTrainerProData)
 - Robuste Eingabevalidierung und Fehlermeldungen für Texteingaben
 - Erweiterte GUI mit Menüoptionen (Thema ändern, Schriftgröße, Fortschritt zurücksetzen)
+- Satzkorrekturen werden Wort für Wort abgeglichen (Teilpunkte je behobenem Fehler, Live-Hinweise)
+- Dunkles/helles Thema und Schriftgrößen mit zwischengespeicherten Paletten und Stylesheets (settings.json)
 """
 import sys
 import random
@@ -17,14 +19,20 @@ import json
 import time
 import os
 import logging
+import re
+from collections import Counter, namedtuple
+from difflib import SequenceMatcher
 from enum import Enum
+from functools import lru_cache
+from itertools import zip_longest
+from types import MappingProxyType
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QLabel,
     QPushButton, QLineEdit, QStackedWidget, QMessageBox, QComboBox, 
-    QProgressBar, QHBoxLayout, QCheckBox
+    QProgressBar, QHBoxLayout, QCheckBox, QInputDialog
 )
 from PyQt6.QtCore import Qt, QTimer, QSize
-from PyQt6.QtGui import QFont, QAction
+from PyQt6.QtGui import QFont, QAction, QColor, QPalette
 
 # Logging-Konfiguration
 logging.basicConfig(level=logging.DEBUG, format="%(asctime)s [%(levelname)s] %(message)s")
@@ -63,12 +71,201 @@ def get_tip_of_the_day():
     ]
     return random.choice(tips)
 
+# ---------------- Themen & Schriftgrößen ---------------
+# Farbwerte je Thema. Hintergrund und Standardtext laufen über die QPalette,
+# nur Widgets mit eigener Rolle (siehe WIDGET_STYLES) bekommen ein Stylesheet.
+THEMES = {
+    "Dunkel": {
+        "window": "#222222",
+        "base": "#2d2d2d",
+        "text": "#ffffff",
+        "button": "#333333",
+        "highlight": "#008080",
+        "title": "#ecf0f1",
+        "highscore": "yellow",
+        "achievement": "lightgreen",
+    },
+    "Hell": {
+        "window": "#f5f5f5",
+        "base": "#ffffff",
+        "text": "#222222",
+        "button": "#e0e0e0",
+        "highlight": "#008080",
+        "title": "#2c3e50",
+        "highscore": "#b7950b",
+        "achievement": "#1e8449",
+    },
+}
+
+# Basisschriftgröße in Pixeln
+FONT_SIZES = {"Klein": 13, "Normal": 16, "Groß": 20}
+
+DEFAULT_THEME = "Dunkel"
+DEFAULT_FONT_SIZE = FONT_SIZES["Normal"]
+
+# Stylesheet-Vorlagen je Widget-Rolle: (Faktor zur Basisschriftgröße, Vorlage mit Themenfarben)
+WIDGET_STYLES = {
+    "title": (2.0, "font-weight: 700; color: {title};"),
+    "input": (1.125, ""),
+    "answer": (1.5, ""),
+    "highscore": (1.25, "color: {highscore};"),
+    "statistics": (1.5, "color: {text};"),
+    "achievement": (1.25, "color: {achievement};"),
+    "button_primary": (1.0, "background-color: {highlight}; color: white; padding: 10px; border-radius: 10px;"),
+    "button_success": (1.0, "background-color: #27ae60; color: white; padding: 10px; border-radius: 10px;"),
+    "button_danger": (1.0, "background-color: #d35400; color: white; padding: 10px; border-radius: 10px;"),
+    "hint": (1.0, "color: {achievement};"),
+}
+
+@lru_cache(maxsize=None)
+def compile_theme(theme_name, font_size):
+    """
+    Erstellt Palette, Schrift und Stylesheets für eine Kombination aus Thema und Schriftgröße.
+    Das Ergebnis wird zwischengespeichert, sodass jeder Wechsel nur einmal berechnet wird.
+    """
+    colors = THEMES[theme_name]
+    palette = QPalette()
+    palette.setColor(QPalette.ColorRole.Window, QColor(colors["window"]))
+    palette.setColor(QPalette.ColorRole.WindowText, QColor(colors["text"]))
+    palette.setColor(QPalette.ColorRole.Base, QColor(colors["base"]))
+    palette.setColor(QPalette.ColorRole.AlternateBase, QColor(colors["window"]))
+    palette.setColor(QPalette.ColorRole.Text, QColor(colors["text"]))
+    palette.setColor(QPalette.ColorRole.Button, QColor(colors["button"]))
+    palette.setColor(QPalette.ColorRole.ButtonText, QColor(colors["text"]))
+    palette.setColor(QPalette.ColorRole.ToolTipBase, QColor(colors["base"]))
+    palette.setColor(QPalette.ColorRole.ToolTipText, QColor(colors["text"]))
+    palette.setColor(QPalette.ColorRole.Highlight, QColor(colors["highlight"]))
+    palette.setColor(QPalette.ColorRole.HighlightedText, QColor("white"))
+
+    font = QFont()
+    font.setPixelSize(font_size)
+
+    stylesheets = {
+        role: f"font-size: {round(font_size * factor)}px; {template.format(**colors)}".strip()
+        for role, (factor, template) in WIDGET_STYLES.items()
+    }
+    return palette, font, MappingProxyType(stylesheets)
+
+# ---------------- Satzkorrektur (tokenweise Bewertung) ---------------
+class ErrorType(Enum):
+    GROSSSCHREIBUNG = "Großschreibung"
+    ZEICHENSETZUNG = "Zeichensetzung"
+    RECHTSCHREIBUNG = "Rechtschreibung"
+
+# Wörter (inkl. Bindestrich-Wörter) und einzelne Satzzeichen als eigene Tokens
+TOKEN_PATTERN = re.compile(r"\w+(?:-\w+)*|[^\w\s]")
+PUNCTUATION_PATTERN = re.compile(r"[^\w\s]")
+
+# position: Index des Lösungstokens, an dem der Fehler liegt (bei überzähligen Tokens die Einfügestelle)
+SentenceError = namedtuple("SentenceError", ["category", "expected", "given", "position"])
+GradingResult = namedtuple("GradingResult", ["credit", "errors", "category_credit", "introduced"])
+
+class SentenceCorrection(str):
+    """
+    Lösung einer Korrekturaufgabe: der richtige Satz plus der fehlerhafte Ausgangssatz.
+    Wird statt über den Zeichenkettenvergleich tokenweise bewertet.
+    """
+    def __new__(cls, solution, original):
+        obj = super().__new__(cls, solution)
+        obj.original = original
+        return obj
+
+    def grade(self, answer):
+        return grade_correction(answer, str(self), self.original)
+
+def tokenize(text):
+    """Zerlegt einen Satz in Wort- und Satzzeichen-Tokens."""
+    return tuple(TOKEN_PATTERN.findall(text))
+
+@lru_cache(maxsize=None)
+def reference_tokens(sentence):
+    """Tokenisierung der Lösungs- und Ausgangssätze, einmal pro Satz berechnet."""
+    return tokenize(sentence)
+
+def classify_error(expected, given):
+    """Ordnet ein abweichendes Tokenpaar einer Fehlerart zu (fehlende Tokens sind None)."""
+    if expected is not None and given is not None and expected.lower() == given.lower():
+        return ErrorType.GROSSSCHREIBUNG
+    if any(token is not None and PUNCTUATION_PATTERN.fullmatch(token) for token in (expected, given)):
+        return ErrorType.ZEICHENSETZUNG
+    return ErrorType.RECHTSCHREIBUNG
+
+def align_tokens(given, expected):
+    """
+    Gleicht die Tokens der Antwort mit denen der Lösung ab (ohne Beachtung der Groß-/Kleinschreibung)
+    und liefert alle Abweichungen als SentenceError.
+    """
+    errors = []
+    matcher = SequenceMatcher(None, [t.lower() for t in given], [t.lower() for t in expected], autojunk=False)
+    for tag, g1, g2, e1, e2 in matcher.get_opcodes():
+        if tag == "equal":
+            for offset, (g, e) in enumerate(zip(given[g1:g2], expected[e1:e2])):
+                if g != e:
+                    errors.append(SentenceError(ErrorType.GROSSSCHREIBUNG, e, g, e1 + offset))
+            continue
+        for offset, (g, e) in enumerate(zip_longest(given[g1:g2], expected[e1:e2])):
+            errors.append(SentenceError(classify_error(e, g), e, g, min(e1 + offset, e2)))
+    return tuple(errors)
+
+@lru_cache(maxsize=None)
+def baseline_errors(original, reference):
+    """Fehler im Ausgangssatz der Aufgabe, d.h. die Fehler, die behoben werden sollen."""
+    return align_tokens(reference_tokens(original), reference_tokens(reference))
+
+@lru_cache(maxsize=256)
+def grade_correction(answer, reference, original):
+    """
+    Bewertet eine Satzkorrektur. Ein Fehler des Ausgangssatzes gilt als behoben, wenn die Antwort
+    an derselben Stelle der Lösung keinen Fehler derselben Fehlerart mehr hat. Ein anderer Fehler
+    an dieser Stelle zählt als neu eingebaut.
+    - category_credit: Anteil der behobenen Ausgangsfehler je Fehlerart. Neu eingebaute Fehler
+      zählen hier nicht, sie werden in introduced gesondert ausgewiesen.
+    - credit: behobene Ausgangsfehler / (Ausgangsfehler + neu eingebaute Fehler). Neue Fehler senken
+      die Punkte, heben einen behobenen Fehler aber nie ganz auf. Nur eine fehlerfreie Antwort erreicht 1.0.
+    Ergebnisse werden zwischengespeichert, da die Bewertung bei jeder Eingabe für die Live-Hinweise läuft.
+    """
+    errors = align_tokens(tokenize(answer), reference_tokens(reference))
+    baseline = baseline_errors(original, reference)
+    error_spots = {(error.position, error.expected, error.category) for error in errors}
+    baseline_spots = {(error.position, error.expected, error.category) for error in baseline}
+    fixed = [error for error in baseline if (error.position, error.expected, error.category) not in error_spots]
+    introduced = tuple(
+        error for error in errors if (error.position, error.expected, error.category) not in baseline_spots
+    )
+
+    fixed_counts = Counter(error.category for error in fixed)
+    category_credit = {
+        category: fixed_counts[category] / total
+        for category, total in Counter(error.category for error in baseline).items()
+    }
+    if baseline:
+        credit = len(fixed) / (len(baseline) + len(introduced))
+    else:
+        credit = 0.0 if errors else 1.0
+    return GradingResult(credit, errors, MappingProxyType(category_credit), introduced)
+
+def describe_errors(result):
+    """Kurzbeschreibung der verbleibenden Fehler, z.B. 'Noch 2 Fehler: 1× Großschreibung, 1× Zeichensetzung'."""
+    if not result.errors:
+        return "Alles richtig!"
+    counts = Counter(error.category for error in result.errors)
+    details = ", ".join(f"{count}× {category.value}" for category, count in counts.items())
+    return f"Noch {len(result.errors)} Fehler: {details}"
+
+def describe_credit(result):
+    """Behobene Fehler je Fehlerart, z.B. 'Großschreibung: 67%, Zeichensetzung: 100% (1 neuer Fehler)'."""
+    details = ", ".join(f"{category.value}: {share:.0%}" for category, share in result.category_credit.items())
+    if result.introduced:
+        details += f" ({len(result.introduced)} neue{'r' if len(result.introduced) == 1 else ''} Fehler)"
+    return details
+
 class DeutschTrainerPro(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Deutsch Trainer Pro")
         self.setGeometry(100, 100, 800, 600)
-        self.setStyleSheet("background-color: #222; color: white; font-size: 16px;")
+        # Palette auch an Dialoge (QMessageBox, QInputDialog) weitergeben
+        self.setAttribute(Qt.WidgetAttribute.WA_WindowPropagation)
         
         # Initiale Variablen für den Trainingszustand
         self.current_solution = None
@@ -85,6 +282,14 @@ class DeutschTrainerPro(QMainWindow):
         self.user_profiles = self.load_profiles()
         self.current_user = None
 
+        # Darstellung: registrierte Widgets je Stylesheet-Rolle und zuletzt gesetzte Werte
+        self.settings = self.load_settings()
+        self.styled_widgets = {}
+        self.applied_styles = {}
+        self.current_theme = None
+        self.current_font_size = None
+        self.last_theme_switch_ms = 0.0
+
         # Timer initialisieren
         self.timer = QTimer()
         self.timer.timeout.connect(self.time_out)
@@ -105,6 +310,8 @@ class DeutschTrainerPro(QMainWindow):
         self.stacked_widget.addWidget(self.selection_page)
         self.stacked_widget.addWidget(self.problem_page)
         self.stacked_widget.addWidget(self.result_page)
+        # Gespeichertes Thema und Schriftgröße anwenden
+        self.apply_theme(self.settings["theme"], self.settings["font_size"])
         
         logging.info("Deutsch Trainer Pro gestartet")
         self.show()
@@ -126,10 +333,66 @@ class DeutschTrainerPro(QMainWindow):
         settings_menu.addAction(reset_action)
     
     def change_theme(self):
-        QMessageBox.information(self, "Thema ändern", "Die Funktion 'Thema ändern' ist noch nicht implementiert.")
+        themes = list(THEMES)
+        theme, ok = QInputDialog.getItem(
+            self, "Thema ändern", "Wähle ein Farbschema:",
+            themes, themes.index(self.current_theme), False
+        )
+        if ok and theme != self.current_theme:
+            self.apply_theme(theme, self.current_font_size)
+            self.settings["theme"] = theme
+            self.save_settings()
     
     def change_font_size(self):
-        QMessageBox.information(self, "Schriftgröße anpassen", "Die Funktion 'Schriftgröße anpassen' ist noch nicht implementiert.")
+        names = list(FONT_SIZES)
+        current = next((n for n, size in FONT_SIZES.items() if size == self.current_font_size), "Normal")
+        name, ok = QInputDialog.getItem(
+            self, "Schriftgröße anpassen", "Wähle eine Schriftgröße:",
+            names, names.index(current), False
+        )
+        if ok and FONT_SIZES[name] != self.current_font_size:
+            self.apply_theme(self.current_theme, FONT_SIZES[name])
+            self.settings["font_size"] = FONT_SIZES[name]
+            self.save_settings()
+
+    def style_widget(self, widget, role):
+        """
+        Registriert ein Widget für eine Stylesheet-Rolle aus WIDGET_STYLES.
+        Das Stylesheet wird in apply_theme gesetzt.
+        """
+        self.styled_widgets.setdefault(role, []).append(widget)
+        return widget
+
+    def apply_theme(self, theme_name, font_size):
+        """
+        Wendet Thema und Schriftgröße an, ohne das ganze Fenster neu zu stylen.
+        Palette und Schrift werden nur bei Änderung gesetzt, Stylesheets nur für Rollen,
+        deren Inhalt sich gegenüber dem letzten Wechsel geändert hat.
+        Gibt die benötigte Zeit in Millisekunden zurück.
+        """
+        start = time.perf_counter()
+        palette, font, stylesheets = compile_theme(theme_name, font_size)
+        if theme_name != self.current_theme:
+            self.setPalette(palette)
+        if font_size != self.current_font_size:
+            self.setFont(font)
+
+        updated_roles = 0
+        for role, widgets in self.styled_widgets.items():
+            stylesheet = stylesheets[role]
+            if self.applied_styles.get(role) == stylesheet:
+                continue
+            for widget in widgets:
+                widget.setStyleSheet(stylesheet)
+            self.applied_styles[role] = stylesheet
+            updated_roles += 1
+
+        self.current_theme = theme_name
+        self.current_font_size = font_size
+        self.last_theme_switch_ms = (time.perf_counter() - start) * 1000
+        logging.info("Thema '%s' mit Schriftgröße %dpx in %.2f ms angewendet (%d Rollen aktualisiert)",
+                     theme_name, font_size, self.last_theme_switch_ms, updated_roles)
+        return self.last_theme_switch_ms
     
     def reset_progress(self):
         reply = QMessageBox.question(
@@ -158,46 +421,46 @@ class DeutschTrainerPro(QMainWindow):
         
         title = QLabel("Deutsch Trainer Pro")
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title.setStyleSheet("font-size: 32px; font-weight: 700; color: #2c3e50;")
+        self.style_widget(title, "title")
         layout.addWidget(title)
 
         # Eingabefeld für Name
         self.name_input = QLineEdit()
         self.name_input.setPlaceholderText("Dein Name...")
-        self.name_input.setStyleSheet("font-size: 18px;")
+        self.style_widget(self.name_input, "input")
         self.name_input.setToolTip("Gib deinen Namen ein")
         layout.addWidget(self.name_input)
         
         # Auswahl der Klassenstufe (1-4)
         self.class_selection = QComboBox()
         self.class_selection.addItems(["Klasse 1", "Klasse 2", "Klasse 3", "Klasse 4"])
-        self.class_selection.setStyleSheet("font-size: 18px;")
+        self.style_widget(self.class_selection, "input")
         self.class_selection.setToolTip("Wähle deine Klassenstufe aus")
         layout.addWidget(self.class_selection)
 
         # Auswahl des Schwierigkeitsgrads (Einfach/Mittel/Schwer)
         self.difficulty_selection = QComboBox()
         self.difficulty_selection.addItems(["Einfach", "Mittel", "Schwer"])
-        self.difficulty_selection.setStyleSheet("font-size: 18px;")
+        self.style_widget(self.difficulty_selection, "input")
         self.difficulty_selection.setToolTip("Wähle den Schwierigkeitsgrad")
         layout.addWidget(self.difficulty_selection)
 
         # Option für Timer deaktivieren
         self.timer_checkbox = QCheckBox("Timer deaktivieren")
-        self.timer_checkbox.setStyleSheet("font-size: 18px;")
+        self.style_widget(self.timer_checkbox, "input")
         self.timer_checkbox.setToolTip("Aktiviere oder deaktiviere den Timer pro Aufgabe")
         layout.addWidget(self.timer_checkbox)
         
         # Eingabefeld für Anzahl der Aufgaben
         self.num_problems_input = QLineEdit()
         self.num_problems_input.setPlaceholderText("Anzahl der Aufgaben (Standard: 10)")
-        self.num_problems_input.setStyleSheet("font-size: 18px;")
+        self.style_widget(self.num_problems_input, "input")
         self.num_problems_input.setToolTip("Gib die Anzahl der Aufgaben pro Sitzung ein")
         layout.addWidget(self.num_problems_input)
 
         # Start-Button
         start_btn = QPushButton("Jetzt starten!")
-        start_btn.setStyleSheet("background-color: #008080; color: white; padding: 10px; border-radius: 10px;")
+        self.style_widget(start_btn, "button_primary")
         start_btn.clicked.connect(self.start_trainer)
         layout.addWidget(start_btn)
         
@@ -212,22 +475,30 @@ class DeutschTrainerPro(QMainWindow):
         # Label für die Aufgabenstellung
         self.problem_label = QLabel("Aufgabe: ?")
         self.problem_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.problem_label.setStyleSheet("font-size: 32px; font-weight: 700; color: #2c3e50;")
+        self.style_widget(self.problem_label, "title")
         layout.addWidget(self.problem_label)
 
         # Eingabefeld für die Antwort
         self.answer_input = QLineEdit()
         self.answer_input.setPlaceholderText("Antwort eingeben...")
         self.answer_input.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.answer_input.setStyleSheet("font-size: 24px;")
+        self.style_widget(self.answer_input, "answer")
         self.answer_input.setToolTip("Gib deine Antwort hier ein")
         # Wenn Enter gedrückt wird, Antwort prüfen
         self.answer_input.returnPressed.connect(self.check_answer)
+        # Live-Hinweise für Korrekturaufgaben bei jeder Eingabe
+        self.answer_input.textChanged.connect(self.update_live_hint)
         layout.addWidget(self.answer_input)
 
+        # Label für Live-Hinweise (nur bei Korrekturaufgaben)
+        self.hint_label = QLabel("")
+        self.hint_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.style_widget(self.hint_label, "hint")
+        layout.addWidget(self.hint_label)
+
         # Button zum Prüfen der Antwort
         check_btn = QPushButton("Antwort prüfen")
-        check_btn.setStyleSheet("background-color: #008080; color: white; padding: 10px; border-radius: 10px;")
+        self.style_widget(check_btn, "button_primary")
         check_btn.clicked.connect(self.check_answer)
         layout.addWidget(check_btn)
         
@@ -240,12 +511,12 @@ class DeutschTrainerPro(QMainWindow):
         # Label für Punktestand und Level
         self.highscore_label = QLabel("Punkte: 0 | Level: 1")
         self.highscore_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.highscore_label.setStyleSheet("font-size: 20px; color: yellow;")
+        self.style_widget(self.highscore_label, "highscore")
         layout.addWidget(self.highscore_label)
         
         # Button zurück zum Hauptmenü
         self.back_button = QPushButton("Zurück zum Hauptmenü")
-        self.back_button.setStyleSheet("background-color: #d35400; color: white; padding: 10px; border-radius: 10px;")
+        self.style_widget(self.back_button, "button_danger")
         self.back_button.clicked.connect(self.go_to_main_menu)
         layout.addWidget(self.back_button)
         
@@ -260,30 +531,30 @@ class DeutschTrainerPro(QMainWindow):
 
         self.result_label = QLabel("Ergebnisse")
         self.result_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.result_label.setStyleSheet("font-size: 32px; font-weight: 700; color: #2c3e50;")
+        self.style_widget(self.result_label, "title")
         layout.addWidget(self.result_label)
 
         # Statistiken (Punkte, richtige/falsche Antworten, Zeit, Tipp des Tages)
         self.statistics_label = QLabel("")
         self.statistics_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.statistics_label.setStyleSheet("font-size: 24px; color: white;")
+        self.style_widget(self.statistics_label, "statistics")
         layout.addWidget(self.statistics_label)
 
         # Achievements-Anzeige
         self.achievement_label = QLabel("")
         self.achievement_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.achievement_label.setStyleSheet("font-size: 20px; color: lightgreen;")
+        self.style_widget(self.achievement_label, "achievement")
         layout.addWidget(self.achievement_label)
 
         # Button zum Neustart
         self.restart_button = QPushButton("Erneut spielen")
-        self.restart_button.setStyleSheet("background-color: #27ae60; color: white; padding: 10px; border-radius: 10px;")
+        self.style_widget(self.restart_button, "button_success")
         self.restart_button.clicked.connect(self.restart_game)
         layout.addWidget(self.restart_button)
         
         # Button zurück zum Hauptmenü (von Ergebnis-Seite aus)
         self.back_to_menu_button = QPushButton("Zum Hauptmenü")
-        self.back_to_menu_button.setStyleSheet("background-color: #d35400; color: white; padding: 10px; border-radius: 10px;")
+        self.style_widget(self.back_to_menu_button, "button_danger")
         self.back_to_menu_button.clicked.connect(self.go_to_main_menu)
         layout.addWidget(self.back_to_menu_button)
 
@@ -457,7 +728,8 @@ class DeutschTrainerPro(QMainWindow):
                 ("Welches Wort ist ein Nomen? 'Baum, rennt, schön'", "Baum")
             ],
             "Rechtschreibung": [
-                ("Finde 3 Fehler: 'Diße Katze liegt auf dem teppich'", ("Diße, teppich", "diese, Teppich")),
+                ("Finde die 3 Fehler und schreibe den Satz richtig: 'Diße Katze liegt auf dem teppich'",
+                 SentenceCorrection("Diese Katze liegt auf dem Teppich.", "Diße Katze liegt auf dem teppich")),
                 ("Bilde eine Zusammensetzung aus 'Fahr' und 'Rad'", ("Fahrrad", "fahrrad")),
                 ("Schreibe das Wort richtig: 'Schmetterlng'", "Schmetterling"),
                 ("Setze ß oder ss ein: 'Fu__ball'", "Fußball")
@@ -484,10 +756,12 @@ class DeutschTrainerPro(QMainWindow):
                 ("Nenne das Akkusativobjekt im Satz: 'Der Hund fängt den Ball.'", "den Ball")
             ],
             "Rechtschreibung": [
-                ("Schreibe den Satz korrekt: 'gestern waren Wir im zoo'", "Gestern waren wir im Zoo."),
+                ("Schreibe den Satz korrekt: 'gestern waren Wir im zoo'",
+                 SentenceCorrection("Gestern waren wir im Zoo.", "gestern waren Wir im zoo")),
                 ("Welches Wort ist richtig geschrieben: 'wahrscheinlich' oder 'wahr scheinlich'?", "wahrscheinlich"),
                 ("Wie schreibt man 'Fluss' im Plural?", "Flüsse"),
-                ("Setze das Komma richtig: 'Ich mag Hunde Katzen und Vögel.'", "Ich mag Hunde, Katzen und Vögel.")
+                ("Setze das Komma richtig: 'Ich mag Hunde Katzen und Vögel.'",
+                 SentenceCorrection("Ich mag Hunde, Katzen und Vögel.", "Ich mag Hunde Katzen und Vögel."))
             ],
             "Textverständnis": [
                 ("Interpretiere: 'Die Uhr tickt laut.' Was könnte das bedeuten?", ("Eile", "Stress", "Zeitdruck")),
@@ -512,12 +786,25 @@ class DeutschTrainerPro(QMainWindow):
         # Bei Deutschübungen behandeln wir alle Antworten als Text (Strings)
         return text
 
+    def update_live_hint(self, text):
+        """
+        Zeigt bei Korrekturaufgaben während der Eingabe an, wie viele Fehler noch im Satz sind.
+        """
+        if not isinstance(self.current_solution, SentenceCorrection) or not text.strip():
+            self.hint_label.setText("")
+            return
+        self.hint_label.setText(describe_errors(self.current_solution.grade(text)))
+
     def validate_answer(self, user_answer):
         """
         Prüft, ob die gegebene Antwort mit der Lösung übereinstimmt.
         Für Textantworten muss die Zeichenfolge exakt mit der erwarteten übereinstimmen (Groß-/Kleinschreibung beachten).
         Bei mehreren zulässigen Antworten wird geprüft, ob eine davon getroffen wurde.
+        Korrekturaufgaben (SentenceCorrection) werden tokenweise bewertet und sind nur ohne Restfehler richtig.
         """
+        if isinstance(self.current_solution, SentenceCorrection):
+            return not self.current_solution.grade(user_answer).errors
+
         # Normalisierung der Eingabe
         user_answer = user_answer.strip().lower().replace(" ", "").replace(".", "").replace(",", "")
         
@@ -554,8 +841,24 @@ class DeutschTrainerPro(QMainWindow):
                     correct_solution_display = self.current_solution[0]
                 else:
                     correct_solution_display = self.current_solution
-                QMessageBox.warning(self, "Falsch!", f"Leider falsch, die richtige Antwort war {correct_solution_display}.")
-                logging.info("Aufgabe %d falsch gelöst", self.current_problem_number + 1)
+                if isinstance(self.current_solution, SentenceCorrection):
+                    # Teilpunkte für jeden behobenen Fehler
+                    result = self.current_solution.grade(user_answer)
+                    points = round(10 * result.credit)
+                    self.score += points
+                    self.user_profiles[self.current_user]['xp'] += points
+                    QMessageBox.warning(
+                        self, "Teilweise richtig!" if points else "Falsch!",
+                        f"{describe_errors(result)}\nBehoben: {describe_credit(result)}\n"
+                        f"Du bekommst {points} von 10 Punkten.\n"
+                        f"Richtig wäre: {correct_solution_display}"
+                    )
+                    logging.info("Aufgabe %d teilweise gelöst (%d Punkte, %d Fehler, behoben: %s)",
+                                 self.current_problem_number + 1, points, len(result.errors),
+                                 describe_credit(result))
+                else:
+                    QMessageBox.warning(self, "Falsch!", f"Leider falsch, die richtige Antwort war {correct_solution_display}.")
+                    logging.info("Aufgabe %d falsch gelöst", self.current_problem_number + 1)
             # Level ggf. aktualisieren (und Achievement hinzufügen)
             self.update_level()
             # Nächste Aufgabe vorbereiten
@@ -676,6 +979,41 @@ class DeutschTrainerPro(QMainWindow):
             logging.error("Fehler beim Laden der Profile: %s", e)
             return {}
 
+    def save_settings(self):
+        """
+        Speichert die Darstellungseinstellungen (Thema, Schriftgröße) in einer JSON-Datei.
+        """
+        settings_path = resource_path("settings.json")
+        try:
+            with open(settings_path, "w") as f:
+                json.dump(self.settings, f)
+        except Exception as e:
+            logging.error("Fehler beim Speichern der Einstellungen: %s", e)
+
+    def load_settings(self):
+        """
+        Lädt die Darstellungseinstellungen. Unbekannte oder fehlende Werte werden durch die Standardwerte ersetzt.
+        """
+        settings = {"theme": DEFAULT_THEME, "font_size": DEFAULT_FONT_SIZE}
+        settings_path = resource_path("settings.json")
+        try:
+            with open(settings_path, "r") as f:
+                stored = json.load(f)
+        except FileNotFoundError:
+            return settings
+        except Exception as e:
+            logging.error("Fehler beim Laden der Einstellungen: %s", e)
+            return settings
+        if not isinstance(stored, dict):
+            logging.error("Ungültiges Format der Einstellungen: %r", stored)
+            return settings
+        if stored.get("theme") in THEMES:
+            settings["theme"] = stored["theme"]
+        font_size = stored.get("font_size")
+        if isinstance(font_size, int) and font_size in FONT_SIZES.values():
+            settings["font_size"] = font_size
+        return settings
+
 # Hauptprogrammstart
 if __name__ == "__main__":
     app = QApplication(sys.argv)